@@ -14,7 +14,6 @@ from pathlib import Path
 import sys
 from uuid import uuid4
 
-from jinja2 import Environment, FileSystemLoader
 from layerstack.args import ArgList, KwargDict, ArgMode
 from layerstack import (DEFAULT_LOG_FORMAT, LayerStackError, checksum, 
     load_module_from_file, start_console_log)
@@ -22,6 +21,10 @@ from layerstack import (DEFAULT_LOG_FORMAT, LayerStackError, checksum,
 
 logger = logging.getLogger(__name__)
 
+#: dict: layer.py modules already loaded by :meth:`Layer.load_layer`, keyed on
+#: absolute file path, with values ((mtime in ns, size, inode), module)
+_LAYER_MODULE_CACHE = {}
+
 
 class LayerBase(object):
     """
@@ -96,7 +99,7 @@ class LayerBase(object):
     # TODO: Split main into parser and execution. Should be able to re-use
     # parser-part for workflows. Execution part should call Stack.run.
     @classmethod
-    def main(cls, log_format=DEFAULT_LOG_FORMAT):
+    def main(cls, log_format=DEFAULT_LOG_FORMAT, argv=None):
         """
         Single-layer command-line interface entry point.
 
@@ -105,6 +108,8 @@ class LayerBase(object):
         log_format : str
             custom logging format to use with the logging package via 
             layerstack.start_console_log
+        argv : None or list of str
+            command-line arguments to parse. defaults to sys.argv[1:]
         """
         # Create argument parser
         desc = cls._cli_desc()
@@ -120,7 +125,7 @@ class LayerBase(object):
         kwarg_dict.add_arguments(parser, short_names=['r', 'd', 'h'])
 
         # Parse args and set values        
-        cli_args = parser.parse_args()
+        cli_args = parser.parse_args(argv)
         arg_list.mode = ArgMode.USE
         arg_list.set_args(cli_args)
         kwarg_dict.mode = ArgMode.USE
@@ -452,7 +457,10 @@ class Layer(object):
             raise LayerStackError(f"The new directory to be created, {dir_path}, already exists.")
         dir_path.mkdir()
 
-        # Create the layer.py file
+        # Create the layer.py file. jinja2 is imported here rather than at 
+        # module level so that running a layer.py from the command line does 
+        # not pay for it.
+        from jinja2 import Environment, FileSystemLoader
         j2env = Environment(loader=FileSystemLoader(str(Path(__file__).parent)))
 
         template = j2env.get_template('layer.template')
@@ -560,6 +568,11 @@ class Layer(object):
         """
         Load layer
 
+        The layer.py module is executed once per process and cached. Later 
+        calls for the same path return the same class (sharing any 
+        module-level state) until the file's modification time, size, or 
+        inode changes.
+
         Parameters
         ----------
         layer_dir : 'str'
@@ -570,9 +583,21 @@ class Layer(object):
         'Layer'
             Layer class object
         """
-
-        module = load_module_from_file('loaded_layer_{}'.format(uuid4()),
-                                       Layer.layer_filename(layer_dir))
+        # only execute each layer.py once, unless it has changed on disk
+        # (key is not resolved, so layers reached through symlinked 
+        # directories keep their own __file__ and class)
+        filename = Layer.layer_filename(layer_dir)
+        key = Path(filename).absolute()
+        # size and inode catch edits within one tick of a coarse mtime clock
+        stat = key.stat()
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = _LAYER_MODULE_CACHE.get(key)
+        if (cached is not None) and (cached[0] == signature):
+            module = cached[1]
+        else:
+            module = load_module_from_file('loaded_layer_{}'.format(uuid4()),
+                                           filename)
+            _LAYER_MODULE_CACHE[key] = (signature, module)
 
         candidate = None
         base_classes = [LayerBase, ModelLayerBase]
@@ -12,6 +12,7 @@ from __future__ import print_function, division, absolute_import
 import argparse
 from collections import OrderedDict
 from collections.abc import MutableSequence
+from functools import lru_cache
 import json
 import logging
 from pathlib import Path
@@ -685,6 +686,31 @@ class Stack(MutableSequence):
             raise        
 
 
+def repoint_stack_inplace(stack, run_dir=None, model=None):
+    """
+    Update the run_dir and/or model of an in-memory Stack.
+
+    Parameters
+    ----------
+    stack : :class:`layerstack.stack.Stack`
+        Stack to modify
+    run_dir : str or None
+        run directory to use
+    model : str or None
+        path to starting model
+
+    Returns
+    -------
+    :class:`layerstack.stack.Stack`
+        stack, for convenience
+    """
+    if run_dir is not None:
+        stack.run_dir = run_dir
+    if model is not None:
+        stack.model = model
+    return stack
+
+
 def repoint_stack(p, layer_library_dir=None, original_locations_preferred=True, 
                   run_dir=None, model=None, outfile=None):
     """
@@ -717,10 +743,7 @@ def repoint_stack(p, layer_library_dir=None, original_locations_preferred=True,
         layer_library_dir=layer_library_dir, 
         original_locations_preferred=original_locations_preferred)
     
-    if run_dir is not None:
-        stack.run_dir = run_dir
-    if model is not None:
-        stack.model = model
+    repoint_stack_inplace(stack, run_dir=run_dir, model=model)
 
     filepath = outfile
     if filepath is None:
@@ -732,7 +755,12 @@ def repoint_stack(p, layer_library_dir=None, original_locations_preferred=True,
     return    
 
 
-def parse_args_helper(args):
+@lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Builds the layerstack_stack argument parser. Cached, since the parser is 
+    not modified by parsing and so can be reused.
+    """
     parser = argparse.ArgumentParser("Load and optionally run a stack.")
     
     # all CLI options require loading a Stack json file
@@ -774,7 +802,11 @@ def parse_args_helper(args):
         turn off stack archiving.""", dest='archive', action='store_false')
     parser_run.set_defaults(archive=True)
 
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args_helper(args):
+    return _build_parser().parse_args(args)
 
 
 def main():
@@ -1,20 +1,81 @@
 # -*- coding: utf-8 -*-
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import logging
 import subprocess
 from pathlib import Path
+import shutil
+import sys
 
 here = Path(__file__).parent
-outdir = here / 'outputs'
 layer_library_dir = here / 'layer_library'
+list_args_layer_dir = layer_library_dir / 'test_list_args'
 
 def get_output_str(stdout_stderr):
     if not isinstance(stdout_stderr, bytes):
         stdout_stderr = stdout_stderr.read() # _io.BufferedReader
     return stdout_stderr.decode('ascii').rstrip()
 
+def link_or_copy_dir(src, dst):
+    """
+    Makes dst a symlink to the directory src, or a copy of it where symlinks 
+    cannot be created (e.g., Windows without the required privilege).
+    """
+    try:
+        Path(dst).symlink_to(src, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        shutil.copytree(src, dst)
+
+def remove_dir(path):
+    """
+    Removes a directory made by link_or_copy_dir.
+    """
+    path = Path(path)
+    if path.is_symlink():
+        path.unlink()
+        return
+    shutil.rmtree(path)
+
 def run_command(args, logger, test_name, msg_postfix):
     ret = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     stdout, stderr = ret.communicate()
     stdout = get_output_str(stdout); stderr = get_output_str(stderr)
     logger.debug(f"In {test_name}, stdout:\n{stdout}\nstderr:\n{stderr}\n"
         f"returncode = {ret.returncode}\n{msg_postfix}")
-    return ret, stdout, stderr
\ No newline at end of file
+    return ret, stdout, stderr
+
+def run_layer_inproc(layer_dir, argv):
+    """
+    Runs the single-layer command-line interface of the layer in layer_dir 
+    in this process, i.e., without paying for a new interpreter.
+
+    Returns
+    -------
+    returncode, stdout, stderr
+        int exit code and the str output captured from LayerBase.main
+    """
+    from layerstack.layer import Layer
+    layer = Layer.load_layer(layer_dir)
+
+    # LayerBase.main starts a console log; undo that when it returns
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers); level = root_logger.level
+    # argparse takes the program name from sys.argv[0]
+    old_argv = sys.argv
+    sys.argv = [Layer.layer_filename(layer_dir)] + list(argv)
+
+    stdout = io.StringIO(); stderr = io.StringIO()
+    returncode = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            layer.main(argv=argv)
+    except SystemExit as e:
+        if e.code is not None:
+            returncode = e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.argv = old_argv
+        for handler in root_logger.handlers[:]:
+            if handler not in handlers:
+                root_logger.removeHandler(handler)
+        root_logger.setLevel(level)
+    return returncode, stdout.getvalue().rstrip(), stderr.getvalue().rstrip()
@@ -2,14 +2,70 @@
 :copyright: (c) 2021, Alliance for Sustainable Energy, LLC
 :license: BSD-3
 '''
+import copy
+import shutil
+
 import pytest
 
+from layerstack.layer import Layer
+from layerstack.stack import Stack
+from layerstack.tests import link_or_copy_dir, list_args_layer_dir
+
 def pytest_addoption(parser):
     parser.addoption(
         "--no-clean-up", action="store_true", default=False, 
         help="Pass this option to leave test outputs in place"
     )
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: runs layers in subprocesses; deselect with -m 'not slow'"
+    )
+
 @pytest.fixture(scope="session",autouse=True)
 def clean_up(request):
     return (not request.config.getoption('--no-clean-up'))
+
+@pytest.fixture(scope="session")
+def outdir(tmp_path_factory, clean_up):
+    """
+    Directory for test outputs. Created with tmp_path_factory, so each session
+    (and each pytest-xdist worker) gets its own. Deleted at the end of the 
+    session unless --no-clean-up is passed. Failures to delete (e.g. locked 
+    files on Windows) are ignored; pytest prunes old basetemp directories.
+    """
+    result = tmp_path_factory.mktemp('outputs')
+    yield result
+    if clean_up:
+        shutil.rmtree(result, ignore_errors=True)
+
+@pytest.fixture(scope="session")
+def list_args_layer():
+    """
+    The test_list_args Layer, loaded once per session. Tests that change the 
+    Layer (including its ArgMode) should work on a copy.deepcopy of it.
+    """
+    return Layer(list_args_layer_dir)
+
+@pytest.fixture(scope="session")
+def alt_layer_library_dir(outdir):
+    """
+    Alternate layer library directory containing test_list_args, set up once 
+    per session. Tests must not remove or modify its contents.
+    """
+    result = outdir / 'alt_layer_library'
+    result.mkdir()
+    link_or_copy_dir(list_args_layer_dir, result / 'test_list_args')
+    return result
+
+@pytest.fixture(scope="session")
+def saved_list_args_stack(list_args_layer, outdir):
+    """
+    Path to a Stack of the test_list_args layer, saved once per session. 
+    Tests should Stack.load it rather than modify the file.
+    """
+    stack = Stack(layers = [copy.deepcopy(list_args_layer)], 
+                  name = 'Test List Args Layer')
+    result = outdir / 'saved_list_args_stack.json'
+    stack.save(result)
+    return result
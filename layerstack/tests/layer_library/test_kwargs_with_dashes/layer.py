@@ -48,17 +48,16 @@ class TestKwargsWithDashes(LayerBase):
             Kwarg.name=Kwarg.default).
         '''
         kwarg_dict = super().kwargs()
-        kwarg_dict['hit-rate'] = Kwarg(
-            description="Kwargs starting with h should be allowed")
-        kwarg_dict['hearth-rug-dog'] = Kwarg(
-            description="Short name should be -hrd"
-        )
-        kwarg_dict['heart_rate'] = Kwarg(
-            description="Short name should be -her"
-        )
-        kwarg_dict['herself_running-dearly'] = Kwarg(
-            description="Look deep for a name that works"
-        )
+        kwarg_dict.update((
+            ('hit-rate', Kwarg(
+                description="Kwargs starting with h should be allowed")),
+            ('hearth-rug-dog', Kwarg(
+                description="Short name should be -hrd")),
+            ('heart_rate', Kwarg(
+                description="Short name should be -her")),
+            ('herself_running-dearly', Kwarg(
+                description="Look deep for a name that works")),
+        ))
         return kwarg_dict
 
     @classmethod
@@ -74,11 +74,12 @@ class TestModelDependentArgsKwargs(LayerBaseClassForTestsWithModels):
             KwargDict class instance containing dict of layer's kwargs
         '''
         kwarg_dict = super().kwargs()
+        choices = None if (model is None) or (not model.data) else model.data
         kwarg_dict['data_element'] = Kwarg(
-            default = None if (model is None) or (not model.data) else model.data[0], 
+            default = None if choices is None else choices[0], 
             description = 'Pass in a data element',
             parser = None, 
-            choices = None if (model is None) or (not model.data) else model.data)
+            choices = choices)
         return kwarg_dict
 
     @classmethod
@@ -4,7 +4,12 @@
 '''
 from __future__ import print_function, division, absolute_import
 
+import copy
+from functools import lru_cache
 import json
+import os
+from pathlib import Path
+import shutil
 import subprocess
 import sys
 
@@ -12,13 +17,22 @@ import pytest
 
 from layerstack import ArgMode, LayerStackRuntimeError
 from layerstack.layer import Layer, LayerBase, ModelLayerBase
-from layerstack.tests import layer_library_dir, outdir
-from layerstack.tests.test_session import manage_outdir
+from layerstack.tests import (layer_library_dir, link_or_copy_dir, 
+    list_args_layer_dir)
 
-created_layers_library_dir = outdir / 'test_layer_creation'
+model_dependent_layer_dir = layer_library_dir / 'test_model_dependent_args_kwargs'
+
+
+@lru_cache(maxsize=32)
+def _load_model_json(filename, mtime):
+    # mtime is only part of the cache key, so edited files are re-read
+    with open(filename) as f:
+        return json.load(f)
 
 
 class ModelForTests(object):
+    __slots__ = ('name', 'count', 'data')
+
     def __init__(self, name, count=0, data = []):
         self.name = name
         self.count = count
@@ -32,10 +46,11 @@ class ModelForTests(object):
 
     @classmethod
     def load(cls, filename):
-        json_data = json.load(filename)
+        json_data = _load_model_json(str(filename), os.path.getmtime(filename))
+        # deep copy data so mutating a model cannot reach the cached json
         return ModelForTests(json_data['name'],
                              count = json_data['count'],
-                             data = json_data['data'])
+                             data = copy.deepcopy(json_data['data']))
 
 
 class LayerBaseClassForTestsWithModels(ModelLayerBase):
@@ -52,14 +67,15 @@ class LayerBaseClassForTestsWithModels(ModelLayerBase):
         model.save(model_path)
 
 
-@pytest.fixture(scope='module',autouse=True)
-def create_layer_library_dir(manage_outdir):
-    assert outdir.exists(), outdir
-    assert not created_layers_library_dir.exists()
-    created_layers_library_dir.mkdir()
+@pytest.fixture(scope='module')
+def created_layers_library_dir(outdir):
+    result = outdir / 'test_layer_creation'
+    result.mkdir() # raises FileExistsError if already there
+    return result
 
 
-def test_layer_base():
+@pytest.mark.slow
+def test_layer_base(created_layers_library_dir):
     _layer_dir = Layer.create('Test Layer Base', created_layers_library_dir)
     # should be able to run the layer as-is
     subprocess.check_call([
@@ -68,9 +84,53 @@ def test_layer_base():
         'dummy_arg'])
 
 
+def test_model_for_tests_save_load(outdir):
+    p = outdir / 'test_model_for_tests_save_load.json'
+    ModelForTests('Ada', count = 2, data = ['a', {'b': [1]}]).save(p)
+    model = ModelForTests.load(p)
+    assert (model.name, model.count, model.data) == ('Ada', 2, ['a', {'b': [1]}])
+    model.data.append('c')
+    model.data[1]['b'].append(2)
+    assert ModelForTests.load(p).data == ['a', {'b': [1]}]
+
+
+def test_layer_module_cache():
+    layer_1 = Layer(list_args_layer_dir)
+    layer_2 = Layer(list_args_layer_dir)
+    # same class object, but separate args and kwargs
+    assert layer_1.layer is layer_2.layer
+    assert layer_1.args is not layer_2.args
+    assert layer_1.kwargs is not layer_2.kwargs
+
+
+def test_layer_module_cache_invalidation(tmp_path):
+    layer_dir = tmp_path / 'test_list_args'
+    shutil.copytree(list_args_layer_dir, layer_dir)
+    layer_file = layer_dir / 'layer.py'
+    original = Layer.load_layer(layer_dir)
+
+    # rewrite layer.py right away, possibly within one mtime tick
+    layer_file.write_text(layer_file.read_text() + '\n# edited\n')
+
+    reloaded = Layer.load_layer(layer_dir)
+    assert reloaded is not original
+    assert Layer.load_layer(layer_dir) is reloaded
+
+
+def test_layer_module_cache_symlinked_dir(tmp_path):
+    layer_dir = tmp_path / 'linked'
+    link_or_copy_dir(list_args_layer_dir, layer_dir)
+    original = Layer.load_layer(list_args_layer_dir)
+    linked = Layer.load_layer(layer_dir)
+    assert linked is not original
+    # executed from the path it was reached by, not the symlink target
+    filename = linked.apply.__func__.__code__.co_filename
+    assert Path(filename).parent == layer_dir, filename
+
+
 def test_model_dependent_args_kwargs():
     # without model
-    layer = Layer(layer_library_dir / 'test_model_dependent_args_kwargs')
+    layer = Layer(model_dependent_layer_dir)
     assert not layer.args[1].is_list, layer.args[1]
     assert layer.kwargs['data_element'].choices is None, layer.kwargs['data_element']
     layer.set_arg_mode(ArgMode.USE)
@@ -81,7 +141,7 @@ def test_model_dependent_args_kwargs():
 
     # a model with no data
     model = ModelForTests('Gilbert', count = 2)
-    layer = Layer(layer_library_dir / 'test_model_dependent_args_kwargs', model = model)
+    layer = Layer(model_dependent_layer_dir, model = model)
     assert layer.args[1].is_list, layer.args[1]
     assert layer.args[1].nargs == 2, layer.args[1]
     assert layer.kwargs['data_element'].choices is None, layer.kwargs['data_element']
@@ -96,7 +156,7 @@ def test_model_dependent_args_kwargs():
 
     # a model with data
     model = ModelForTests('Paula', count = 1, data = ['red', 'green', 'purple'])
-    layer = Layer(layer_library_dir / 'test_model_dependent_args_kwargs', model = model)
+    layer = Layer(model_dependent_layer_dir, model = model)
     assert layer.args[1].is_list, layer.args[1]
     assert layer.args[1].nargs == 1, layer.args[1]
     assert len(layer.kwargs['data_element'].choices) == 3, layer.kwargs['data_element']
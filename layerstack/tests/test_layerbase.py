@@ -6,57 +6,53 @@ import logging
 from pathlib import Path
 import sys
 
-from layerstack.tests import layer_library_dir, run_command
+import pytest
+
+from layerstack.tests import (layer_library_dir, list_args_layer_dir, 
+    run_command, run_layer_inproc)
 
 logger = logging.getLogger(__name__)
 
 
-def test_layer_cli():
+@pytest.mark.parametrize("test_list", [['1', '2', '3'], ['a', 'b'], ['x']], 
+                         ids=['ints', 'letters', 'single'])
+def test_layer_cli(caplog, test_list):
+    with caplog.at_level(logging.INFO, logger='layerstack.layers.TestListArgs'):
+        ret, stdout, stderr = run_layer_inproc(list_args_layer_dir, test_list)
+    assert not ret, stderr
+    assert caplog.records[-1].getMessage() == f"Received list_arg: {test_list}", caplog.text
+
+@pytest.mark.slow
+def test_layer_cli_subprocess():
+    # end-to-end check that layer.py works as a script
     test_list = ['1', '2', '3']
 
-    args = [sys.executable, str(layer_library_dir / 'test_list_args' / 'layer.py')] 
+    args = [sys.executable, str(list_args_layer_dir / 'layer.py')] 
     args += test_list
 
-    ret, stdout, stderr = run_command(args, logger, "test_layer_cli", "")
+    ret, stdout, stderr = run_command(args, logger, "test_layer_cli_subprocess", "")
     assert stderr[-15:] == str(test_list), f"stdout:\n{stdout}\nstderr:\n{stderr}"
 
-def test_kwarg_name_clashes():
-    args = [sys.executable, str(layer_library_dir / 'test_kwarg_name_clashes' / 'layer.py')]
+@pytest.mark.parametrize("layer_name, positional_args", [
+    ('test_kwarg_name_clashes', []),
+    ('test_kwargs_with_dashes', [str(734)])
+], ids=['name_clashes', 'with_dashes'])
+def test_kwarg_short_names(layer_name, positional_args):
+    layer_dir = layer_library_dir / layer_name
 
     # run help
-    ret, stdout, stderr = run_command(args + ["--help"], logger, 
-        "test_kwarg_name_clashes", "after calling --help")
-    assert not ret.returncode, stderr
+    ret, stdout, stderr = run_layer_inproc(layer_dir, ["--help"])
+    assert not ret, stderr
+    for short_name in ['-hr', '-hrd', '-her', '-herd']:
+        assert f"{short_name} " in stdout, stdout
     
     to_call = [
         "-hr", str(0.2),
         "-hrd", "Rufus",
         "-her", str(85),
         "-herd", "Anne"
-    ]
-
-    # run layer
-    ret, stdout, stderr = run_command(args + to_call, logger, 
-        "test_kwarg_name_clashes", "after calling with kwargs")
-    assert not ret.returncode, ret.stderr
-
-def test_kwargs_with_dashes():
-    args = [sys.executable, str(layer_library_dir / 'test_kwargs_with_dashes' / 'layer.py')]
-
-    # run help
-    ret, stdout, stderr = run_command(args + ["--help"], logger, 
-            "test_kwargs_with_dashes", "after calling --help")
-    assert not ret.returncode, ret.stderr
-    
-    to_call = [
-        "-hr", str(0.2),
-        "-hrd", "Rufus",
-        "-her", str(85),
-        "-herd", "Anne",
-        str(734)
-    ]
+    ] + positional_args
 
     # run layer
-    ret, stdout, stderr = run_command(args + to_call, logger, 
-            "test_kwargs_with_dashes", "after calling with kwargs")
-    assert not ret.returncode, ret.stderr
+    ret, stdout, stderr = run_layer_inproc(layer_dir, to_call)
+    assert not ret, stderr
@@ -3,13 +3,14 @@
 :license: BSD-3
 '''
 
+import copy
 import pytest
-import shutil
 from pathlib import Path
 import logging
-from layerstack import ArgMode, LayerStackError, Layer, Stack
-from layerstack.tests import layer_library_dir, outdir
-from layerstack.stack import repoint_stack, parse_args_helper
+from layerstack import ArgMode, LayerStackError, Stack
+from layerstack.tests import layer_library_dir, list_args_layer_dir
+from layerstack.stack import (repoint_stack, repoint_stack_inplace, 
+    parse_args_helper)
 
 import subprocess
 from subprocess import Popen, PIPE
@@ -17,19 +18,19 @@ from subprocess import Popen, PIPE
 logger = logging.getLogger(__name__)
 
 
-def test_layer_types():
-    layer = Layer(layer_library_dir / 'test_list_args')
+@pytest.mark.parametrize("make_layers,expected", [
+    (lambda layer: [layer, 1], 'int'),
+    (lambda layer: [layer.layer_dir], 'Path'),
+], ids=['int', 'path'])
+def test_layer_types(list_args_layer, make_layers, expected):
     with pytest.raises(LayerStackError) as excinfo:
-        Stack(layers = [layer, 1])
+        Stack(layers = make_layers(list_args_layer))
 
-    assert 'int' in str(excinfo.value), str(excinfo.value)
+    assert expected in str(excinfo.value), str(excinfo.value)
 
-    with pytest.raises(LayerStackError):
-        Stack(layers = [layer.layer_dir])
 
-
-def test_basic_compose_and_run():
-    layer = Layer(layer_library_dir / 'test_list_args')
+def test_basic_compose_and_run(list_args_layer, outdir):
+    layer = copy.deepcopy(list_args_layer)
     stack = Stack(layers = [layer], 
                   name='Basic Test', 
                   run_dir = outdir / 'test_basic_compose_and_run')
@@ -38,13 +39,9 @@ def test_basic_compose_and_run():
     stack.run()
 
 
-def test_get_layer_dir():
-    alt_layer_library_dir = outdir / 'test_get_layer_dir'
-    alt_layer_library_dir.mkdir()
-
-    orig_layer_dir = layer_library_dir / 'test_list_args' 
+def test_get_layer_dir(alt_layer_library_dir):
+    orig_layer_dir = list_args_layer_dir
     new_layer_dir = alt_layer_library_dir / 'test_list_args'
-    shutil.copytree(orig_layer_dir, new_layer_dir)
 
     test_layer_dir = Stack.get_layer_dir(
         orig_layer_dir, 
@@ -66,13 +63,12 @@ def test_get_layer_dir():
     assert test_layer_dir is None
 
 # *** create new stack and test repointing ***
-def test_repointing_run_dir():
+def test_repointing_run_dir(list_args_layer, outdir):
     
     stack_library_dir = outdir / 'test_stack_repoint'
-    if not stack_library_dir.exists():
-        stack_library_dir.mkdir()
+    stack_library_dir.mkdir(parents=True, exist_ok=True)
 
-    layer = Layer(layer_library_dir / 'test_list_args')
+    layer = copy.deepcopy(list_args_layer)
     stack = Stack(layers = [layer], 
                   name='Basic Test', 
                   run_dir = outdir / 'test_basic_repoint')
@@ -91,7 +87,22 @@ def test_repointing_run_dir():
     assert str(check_stack.run_dir) == str(new_run_dir) 
 
 
-def test_parser():
+def test_repointing_inplace(list_args_layer, outdir):
+    stack = Stack(layers = [list_args_layer], 
+                  name='Basic Test', 
+                  run_dir = outdir / 'test_basic_repoint')
+
+    new_run_dir = outdir / 'new_run_dir'
+    assert repoint_stack_inplace(stack, run_dir = new_run_dir) is stack
+    assert stack.run_dir == new_run_dir
+    assert stack.model is None
+
+    repoint_stack_inplace(stack, model = 'model.json')
+    assert stack.run_dir == new_run_dir
+    assert stack.model == 'model.json'
+
+
+def test_parser(outdir):
     cli_arg_list = ['test_hw_amc_5min_simple.json', 'run', '-sp', str(outdir)]
     args = parse_args_helper(cli_arg_list)
 
@@ -104,6 +115,13 @@ def test_parser():
     assert args.warning_only == False
     assert args.archive == True
 
+    # the cached parser must not carry state between calls
+    args = parse_args_helper(['other.json', '-d', 'list'])
+    assert args.stack_file == 'other.json'
+    assert args.mode == 'list'
+    assert args.debug == True
+    assert not hasattr(args, 'save_path')
+
 
 
 
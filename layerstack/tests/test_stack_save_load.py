@@ -3,72 +3,79 @@
 :license: BSD-3
 '''
 
+import copy
 import pytest
-import shutil
 
-from layerstack import ArgMode, Layer, LayerStackError, Stack
+from layerstack import ArgMode, LayerStackError, Stack
 from layerstack.args import ArgMode
-from layerstack.layer import Layer
 from layerstack.stack import Stack
 
-from layerstack.tests import layer_library_dir, outdir
-from layerstack.tests.test_session import manage_outdir
+from layerstack.tests import link_or_copy_dir, list_args_layer_dir, remove_dir
 
 
-def test_stack_list_args_layer():
-    stack_library_dir = outdir / 'test_stack_save_load'
-    if not stack_library_dir.exists():
-        stack_library_dir.mkdir()
+@pytest.fixture
+def saved_stack(saved_list_args_stack):
+    """
+    Fresh load of the session's saved test_list_args Stack.
+    """
+    return Stack.load(saved_list_args_stack)
 
-    layer = Layer(layer_library_dir / 'test_list_args')
-    stack = Stack(layers = [layer], name = 'Test List Args Layer')
 
-    p = stack_library_dir / 'test_stack_list_args_layer_1.json'
-    stack.save(p)
-    stack = Stack.load(p)
+def test_stack_round_trip(saved_stack, list_args_layer):
+    stack = saved_stack
+    assert stack.name == 'Test List Args Layer'
+    assert len(stack) == 1
+    assert stack[0].name == list_args_layer.name
+    assert stack[0].layer_dir == list_args_layer_dir
+    assert stack[0].args.names == list_args_layer.args.names
+
+
+def test_stack_list_args_layer(saved_stack, tmp_path):
+    stack = saved_stack
 
     stack.layers[0].args.mode = ArgMode.USE
     stack.layers[0].args[0] = ['a', 'b']
 
-    p = stack_library_dir / 'test_stack_list_args_layer_2.json'
+    p = tmp_path / 'test_stack_list_args_layer_2.json'
     stack.save(p)
     stack = Stack.load(p)
 
-    stack.layers[0].args.mode = ArgMode.USE
-    assert (stack.layers[0].args[0] == ['a', 'b']), stack.layers[0]
+    args = stack.layers[0].args
+    args.mode = ArgMode.USE
+    value = args[0]
+    assert value == ['a', 'b'], (value, stack.layers[0])
 
 
-def test_stack_library_dirs():
+def test_stack_library_dirs(list_args_layer, outdir):
     stack_library_dir = outdir / 'test_stack_library_dirs'
-    if not stack_library_dir.exists():
-        stack_library_dir.mkdir()
+    stack_library_dir.mkdir(parents=True, exist_ok=True)
     
-    layer = Layer(layer_library_dir / 'test_list_args')
+    layer = copy.deepcopy(list_args_layer)
     stack = Stack(layers = [layer], name = 'Test Layer Library Dirs Load')
     p = stack_library_dir / 'test_stack_library_dirs_1'
     stack.save(p)
 
     # create alternate location
     alt_layer_library_dir = outdir / 'test_stack_library_dirs'
-    orig_layer_dir = layer_library_dir / 'test_list_args' 
+    orig_layer_dir = list_args_layer_dir
     new_layer_dir = alt_layer_library_dir / 'test_list_args'
-    shutil.copytree(orig_layer_dir, new_layer_dir)
+    link_or_copy_dir(orig_layer_dir, new_layer_dir)
 
     stack = Stack.load(
         p, 
         layer_library_dir=alt_layer_library_dir, 
         original_locations_preferred=True)
-    stack[0].layer_dir == orig_layer_dir
+    assert stack[0].layer_dir == orig_layer_dir, stack[0].layer_dir
 
     stack = Stack.load(
         p, 
         layer_library_dir=alt_layer_library_dir, 
         original_locations_preferred=False)
-    stack[0].layer_dir == new_layer_dir
+    assert stack[0].layer_dir == new_layer_dir, stack[0].layer_dir
     p = stack_library_dir / 'test_stack_library_dirs_2'
     stack.save(p)
 
-    shutil.rmtree(new_layer_dir)
+    remove_dir(new_layer_dir)
 
     with pytest.raises(LayerStackError) as excinfo:
         Stack.load(p)
@@ -1,17 +1,15 @@
 
+import re
 import setuptools
 from pathlib import Path
 
 here = Path(__file__).parent
 
 # Get the long description from the README file
-with open(here / 'README.txt', encoding='utf-8') as f:
-    long_description = f.read()
+long_description = (here / 'README.txt').read_text(encoding='utf-8')
 
-with open(here / 'layerstack' / '_version.py', encoding='utf-8') as f:
-    version = f.read()
-
-version = version.split()[2].strip('"').strip("'")
+version = re.search(r'__version__\s*=\s*["\']([^"\']+)', 
+    (here / 'layerstack' / '_version.py').read_text(encoding='utf-8')).group(1)
 
 setuptools.setup(
     name = 'layerstack',
@@ -39,6 +37,7 @@ setuptools.setup(
             'pandoc',
             'pytest',
             'pytest-ordering',
+            'pytest-xdist',
             'sphinx',
             'sphinx_rtd_theme',
             'twine',